@@ -20,6 +20,17 @@ class Context(TypedDict):
     my_configurable_param: str
 
 
+_client: AsyncOpenAI | None = None
+
+
+def _get_client() -> AsyncOpenAI:
+    """Return the process-wide OpenAI client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    return _client
+
+
 @dataclass
 class State:
     """Input state for the agent.
@@ -31,8 +42,8 @@ class State:
 
 async def call_model(state: State, runtime: Runtime[Context]) -> Dict[str, Any]:
     """Process conversational messages and returns output using OpenAI."""
-    # Initialize OpenAI client
-    client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    # Reuse the shared OpenAI client so its connection pool survives across runs
+    client = _get_client()
 
     # Process the incoming messages
     latest_message = state.messages[-1] if state.messages else {}